@@ -1,45 +1,57 @@
 """Conversion logic for device part numbers and other transformations."""
 
-import re
+from typing import Iterable, Iterator
 
 from models import E3FromToListRow
 
 
-def convert_device_partnumbers(row: E3FromToListRow, device_lut: dict, 
-                               errors: list = None, row_num: int = None) -> tuple:
-    r"""Convert RapidHarness device part numbers to E3.series equivalents.
+def _is_splice(name: str) -> bool:
+    r"""Return True if a device name ends in S followed by digits (S1, S23, ...).
+    
+    Equivalent to searching for ``S\d+\Z`` (for ASCII digits), but uses plain
+    string operations instead of a regex search per endpoint.
+    """
+    # Most device names (J1, P12, ...) contain no 'S' at all; reject those with a
+    # single containment test before rstrip() allocates a new string
+    if not name or "S" not in name:
+        return False
+    stem = name.rstrip("0123456789")
+    return len(stem) < len(name) and stem.endswith("S")
+
+
+def iter_converted_rows(rows: Iterable[E3FromToListRow],
+                        device_lut: dict) -> Iterator[E3FromToListRow]:
+    r"""Lazily convert RapidHarness device part numbers to E3.series equivalents.
     
     Handles:
     - Device lookup table mappings
     - Splice detection (devices named S\d+)
-    - Error logging for unmapped devices
+    
+    Conversion happens as the output writer consumes each row, so rows are
+    converted and written in a single pass.
     
     Args:
-        row: E3FromToListRow with device part numbers to convert
+        rows: Iterable of E3FromToListRow objects
         device_lut: Device lookup table (maps RH P/N to E3 names)
-        errors: List to accumulate ConversionError objects
-        row_num: Row number for error tracking
         
-    Returns:
-        Tuple of (from_device_pn, to_device_pn) with conversions applied
+    Yields:
+        Each row, with from_device_pn and to_device_pn converted in place
     """
-    
-    # Convert FROM device
-    from_converted = row.from_device_pn
-    if row.from_device_pn in device_lut:
-        from_converted = device_lut[row.from_device_pn]
-    elif re.search(r'S\d+$', row.from_device_name or ''):
-        # Splice detection: devices named S1, S2, etc. should have SPLICE part number
-        from_converted = "SPLICE"
-    # Note: Device not found is not an error - device P/Ns are globally unique and may already exist in E3
-    
-    # Convert TO device
-    to_converted = row.to_device_pn
-    if row.to_device_pn in device_lut:
-        to_converted = device_lut[row.to_device_pn]
-    elif re.search(r'S\d+$', row.to_device_name or ''):
-        # Splice detection
-        to_converted = "SPLICE"
-    # Note: Device not found is not an error - device P/Ns are globally unique and may already exist in E3
-    
-    return (from_converted, to_converted)
+    lut_get = device_lut.get
+    for row in rows:
+        # Note: Device not found is not an error - device P/Ns are globally unique
+        # and may already exist in E3, so unmapped P/Ns are left as-is
+        from_converted = lut_get(row.from_device_pn)
+        if from_converted is not None:
+            row.from_device_pn = from_converted
+        elif _is_splice(row.from_device_name):
+            # Splice detection: devices named S1, S2, etc. should have SPLICE part number
+            row.from_device_pn = "SPLICE"
+        
+        to_converted = lut_get(row.to_device_pn)
+        if to_converted is not None:
+            row.to_device_pn = to_converted
+        elif _is_splice(row.to_device_name):
+            row.to_device_pn = "SPLICE"
+        
+        yield row
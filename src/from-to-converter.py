@@ -4,6 +4,7 @@ import click
 from pathlib import Path
 from colorama import init, Fore, Style
 import csv
+from operator import attrgetter
 import openpyxl
 
 # Initialize colorama for cross-platform colored terminal output
@@ -20,11 +21,34 @@ if __name__ == '__main__':
 from __version__ import __version__
 from utils import load_wire_lookup_table, load_device_lookup_table
 from input_parsers import RapidHarnessParser
-from converters import convert_device_partnumbers
+from converters import iter_converted_rows
 from output_writers import write_e3_fromto_list
 from models import ConversionError
 
 
+# Error log CSV columns, each the name of a ConversionError attribute
+ERROR_LOG_FIELDS = ('severity', 'error_type', 'row_number', 'entity_id', 'entity_value', 'description', 'timestamp')
+
+# Number of example rows shown per issue type on the console
+MAX_ISSUE_EXAMPLES = 5
+
+
+class InputRowError(Exception):
+    """Wraps an exception raised while reading rows from the input file.
+    
+    Rows are parsed lazily inside the output write step, so this keeps input
+    failures distinguishable from problems writing the output file.
+    """
+
+
+def guard_input_rows(rows):
+    """Yield from a parser's row iterator, re-raising its failures as InputRowError."""
+    try:
+        yield from rows
+    except Exception as e:
+        raise InputRowError(e) from e
+
+
 @click.command()
 @click.option(
     '--input', '-i',
@@ -122,10 +146,10 @@ def cli_main(input_file, output_file, wire_map_file, device_map_file, verbose, e
     if verbose:
         click.echo("Starting conversion...")
     
-    # Parse input file using RapidHarness parser
+    # Open input file using RapidHarness parser (rows are read lazily below)
     try:
         parser = RapidHarnessParser()
-        e3_fromto = parser.parse(input_file, wire_lut, errors, verbose)
+        e3_fromto = parser.iter_rows(input_file, wire_lut, errors, verbose)
     except click.ClickException:
         raise
     except FileNotFoundError:
@@ -138,17 +162,15 @@ def cli_main(input_file, output_file, wire_map_file, device_map_file, verbose, e
         click.echo(f"Error parsing input file: {e}", err=True)
         raise click.Abort()
     
-    # Convert device part numbers for each row
-    for idx, row in enumerate(e3_fromto, start=2):
-        from_converted, to_converted = convert_device_partnumbers(
-            row, device_lut, errors, idx
-        )
-        row.from_device_pn = from_converted
-        row.to_device_pn = to_converted
-    
-    # Write output
+    # Parse, convert and write in a single streaming pass, so no more than one
+    # row is held in memory at a time
     try:
-        write_e3_fromto_list(e3_fromto, output_file)
+        total_rows = write_e3_fromto_list(
+            iter_converted_rows(guard_input_rows(e3_fromto), device_lut), output_file
+        )
+    except InputRowError as e:
+        click.echo(f"Error parsing input file: {e.__cause__}", err=True)
+        raise click.Abort()
     except PermissionError:
         click.echo(f"Error: Permission denied writing to output file: {output_file}", err=True)
         raise click.Abort()
@@ -156,28 +178,35 @@ def cli_main(input_file, output_file, wire_map_file, device_map_file, verbose, e
         click.echo(f"Error: Cannot write to output file: {e}", err=True)
         raise click.Abort()
     except Exception as e:
-        click.echo(f"Error writing output file: {e}", err=True)
+        click.echo(f"Error converting or writing output file: {e}", err=True)
         raise click.Abort()
     
+    # Report issues grouped by type with a few example rows (every row with
+    # --verbose), instead of one console line per affected row. The error log
+    # has the full list either way.
+    example_limit = None if verbose else MAX_ISSUE_EXAMPLES
+    issues_by_type = {}
+    for error in errors:
+        issues_by_type.setdefault(error.error_type, []).append(error)
+    for error_type, type_errors in issues_by_type.items():
+        severity = type_errors[0].severity
+        color = Fore.RED if severity == "error" else Fore.YELLOW
+        examples = type_errors[:example_limit]
+        lines = [f"{color}[{severity.upper()}] {error_type}: {len(type_errors)} row(s){Style.RESET_ALL}"]
+        lines.extend(f"  Row {error.row_number}: {error.description}" for error in examples)
+        if len(type_errors) > len(examples):
+            lines.append(f"  ... and {len(type_errors) - len(examples)} more (use --verbose to list all)")
+        click.echo("\n".join(lines), err=True)
+    
     # Save error log if requested
     if error_log_file is not None and len(errors) > 0:
         try:
             with open(error_log_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=['severity', 'error_type', 'row_number', 'entity_id', 'entity_value', 'description', 'timestamp']
-                )
-                writer.writeheader()
-                for error in errors:
-                    writer.writerow({
-                        'severity': error.severity,
-                        'error_type': error.error_type,
-                        'row_number': error.row_number,
-                        'entity_id': error.entity_id,
-                        'entity_value': error.entity_value,
-                        'description': error.description,
-                        'timestamp': error.timestamp
-                    })
+                # Positional rows: ConversionError has a fixed schema, so there
+                # is no need to build a dict per error for DictWriter
+                writer = csv.writer(f)
+                writer.writerow(ERROR_LOG_FIELDS)
+                writer.writerows(map(attrgetter(*ERROR_LOG_FIELDS), errors))
             click.echo(f"\n{Fore.CYAN}[OK] Issue log saved to: {error_log_file}{Style.RESET_ALL}")
         except PermissionError:
             click.echo(f"{Fore.RED}[ERROR] Permission denied writing to issue log: {error_log_file}{Style.RESET_ALL}", err=True)
@@ -189,7 +218,6 @@ def cli_main(input_file, output_file, wire_map_file, device_map_file, verbose, e
         click.echo(f"\n{Fore.GREEN}[OK] No issues encountered - no issue log created{Style.RESET_ALL}")
     
     # Summary output
-    total_rows = len(e3_fromto)
     warning_count = sum(1 for e in errors if e.severity == "warning")
     error_count = sum(1 for e in errors if e.severity == "error")
     
@@ -6,22 +6,49 @@ be supported by implementing the InputParser interface.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 import re
 import openpyxl
 import click
-from colorama import Fore, Style
 
-from models import E3FromToListRow, RapidHarnessEndpoint, ConversionError
+from models import E3FromToListRow, ConversionError
+
+
+# First run of digits in a conductor name, e.g. "19" in "W19.Black"
+_WIRE_IDX_RE = re.compile(r'\d+')
 
 
 class InputParser(ABC):
     """Abstract base class for harness data input parsers."""
     
     @abstractmethod
+    def iter_rows(self, input_file: Path, wire_lut: dict, errors: list,
+                  verbose: bool = False) -> Iterator[E3FromToListRow]:
+        """Open input file and return an iterator of E3FromToListRow objects.
+        
+        Implementations should open and validate the input before returning, so
+        file and format problems are raised by this call rather than on first
+        iteration. Rows are then produced lazily, letting the caller convert and
+        write each one without holding the whole harness in memory.
+        
+        Args:
+            input_file: Path to input file
+            wire_lut: Wire lookup table (maps wire names to E3WireComponent)
+            errors: List to accumulate ConversionError objects
+            verbose: Enable verbose output
+            
+        Returns:
+            Iterator of E3FromToListRow objects
+        """
+        pass
+    
     def parse(self, input_file: Path, wire_lut: dict, errors: list, verbose: bool = False):
         """Parse input file and return list of E3FromToListRow objects.
         
+        Materializes iter_rows(); use that directly to stream rows instead.
+        
         Args:
             input_file: Path to input file
             wire_lut: Wire lookup table (maps wire names to E3WireComponent)
@@ -31,14 +58,15 @@ class InputParser(ABC):
         Returns:
             List of E3FromToListRow objects
         """
-        pass
+        return list(self.iter_rows(input_file, wire_lut, errors, verbose))
 
 
 class RapidHarnessParser(InputParser):
     """Parser for RapidHarness Excel exports.
     
     Reads from the 'Connections' sheet starting at row 11 with specific
-    column mappings.
+    column mappings. The workbook is opened in read-only mode and rows are
+    streamed as value tuples, so memory use stays flat for large exports.
     """
     
     # Column indices (1-based for cell references, but documented here for clarity)
@@ -53,8 +81,13 @@ class RapidHarnessParser(InputParser):
     HEADER_ROW = 11  # Data starts at row 11
     SHEET_NAME = "Connections"
     
-    def parse(self, input_file: Path, wire_lut: dict, errors: list, verbose: bool = False):
-        """Parse RapidHarness Excel export.
+    def iter_rows(self, input_file: Path, wire_lut: dict, errors: list,
+                  verbose: bool = False) -> Iterator[E3FromToListRow]:
+        """Open a RapidHarness Excel export and return an iterator over its connections.
+        
+        The workbook is opened and checked for the Connections sheet up front;
+        rows are then parsed as the returned iterator is consumed, and the
+        workbook is closed once it is exhausted.
         
         Args:
             input_file: Path to RapidHarness .xlsx export
@@ -63,75 +96,133 @@ class RapidHarnessParser(InputParser):
             verbose: Enable verbose output
             
         Returns:
-            List of E3FromToListRow objects
+            Iterator of E3FromToListRow objects
         """
         if verbose:
             click.echo("Parsing RapidHarness Excel export...")
         
-        e3_fromto = []
-        rh_workbook = openpyxl.load_workbook(str(input_file))
+        # Read-only mode streams rows from the XML instead of building the full
+        # worksheet in memory; data_only returns cached values instead of formulas
+        rh_workbook = openpyxl.load_workbook(str(input_file), read_only=True, data_only=True)
         
         if self.SHEET_NAME not in rh_workbook.sheetnames:
+            rh_workbook.close()
             raise click.ClickException(f"Missing '{self.SHEET_NAME}' sheet in RapidHarness export")
         
-        sheet = rh_workbook[self.SHEET_NAME]
+        return self._iter_connections(rh_workbook, wire_lut, errors, verbose)
+    
+    def _iter_connections(self, rh_workbook, wire_lut: dict, errors: list,
+                          verbose: bool) -> Iterator[E3FromToListRow]:
+        """Yield one E3FromToListRow per non-blank Connections row, then close the workbook."""
+        row_count = 0
+        # One timestamp for every error in this pass rather than a clock read
+        # and isoformat() per ConversionError
+        parse_timestamp = datetime.now().isoformat()
         
-        for row_num in range(self.HEADER_ROW, sheet.max_row + 1):
-            e3_fromto_row = E3FromToListRow()
-            
-            # Column B: FROM Designation (Connector.Pin format)
-            from_endpoint = RapidHarnessEndpoint(
-                sheet.cell(row=row_num, column=self.COL_FROM_ENDPOINT).value
-            )
-            e3_fromto_row.from_device_name = from_endpoint.get_device_des()
-            e3_fromto_row.from_pin = from_endpoint.get_pin_des()
-            
-            # Column C: TO Designation (Connector.Pin format)
-            to_endpoint = RapidHarnessEndpoint(
-                sheet.cell(row=row_num, column=self.COL_TO_ENDPOINT).value
+        try:
+            sheet = rh_workbook[self.SHEET_NAME]
+            # Don't trust the stored dimension tag - some writers record it wrong,
+            # which would silently truncate rows in read-only mode
+            sheet.reset_dimensions()
+
+            # Each row is a tuple of raw cell values covering only the columns we
+            # read (B through O), so a column's index is COL_* - first_col.
+            # max_col pads short rows so every column index is valid.
+            first_col = self.COL_FROM_ENDPOINT
+            row_iter = sheet.iter_rows(
+                min_row=self.HEADER_ROW, min_col=first_col, max_col=self.COL_SIGNAL_NAME,
+                values_only=True
             )
-            e3_fromto_row.to_device_name = to_endpoint.get_device_des()
-            e3_fromto_row.to_pin = to_endpoint.get_pin_des()
-            
-            # Column D: Conductor (extract wire index, e.g. "19" from "W19.Black")
-            conductor_cell = sheet.cell(row=row_num, column=self.COL_CONDUCTOR).value
-            if conductor_cell:
-                try:
-                    match = re.search(r'\d+', conductor_cell)
-                    if match:
-                        e3_fromto_row.wire_index = int(match.group())
-                except (TypeError, ValueError):
-                    pass  # Skip if conductor format is unexpected
+            # Bind per-row lookups to locals once; attribute and global lookups
+            # inside the loop would otherwise repeat for every row
+            from_idx = self.COL_FROM_ENDPOINT - first_col
+            to_idx = self.COL_TO_ENDPOINT - first_col
+            conductor_idx = self.COL_CONDUCTOR - first_col
+            wire_sku_idx = self.COL_WIRE_SKU - first_col
+            from_pn_idx = self.COL_FROM_DEVICE_PN - first_col
+            to_pn_idx = self.COL_TO_DEVICE_PN - first_col
+            signal_idx = self.COL_SIGNAL_NAME - first_col
+            wire_lut_get = wire_lut.get
+            wire_idx_search = _WIRE_IDX_RE.search
             
-            # Column E: Wire Part Number - lookup in wire table
-            rh_wire_sku = sheet.cell(row=row_num, column=self.COL_WIRE_SKU).value
-            if rh_wire_sku in wire_lut:
-                e3_fromto_row.wire = wire_lut[rh_wire_sku]
-            elif rh_wire_sku is not None:
-                error_msg = f"Wire '{rh_wire_sku}' not found in lookup table"
-                click.echo(f"{Fore.RED}[ERROR] Row {row_num}: {error_msg}{Style.RESET_ALL}", err=True)
-                error = ConversionError(
-                    severity="error",
-                    error_type="WIRE_NOT_FOUND",
-                    row_number=row_num,
-                    entity_id="Wire",
-                    entity_value=str(rh_wire_sku),
-                    description=error_msg
+            for row_num, row_values in enumerate(row_iter, start=self.HEADER_ROW):
+                # Skip blank rows (sheets often report trailing formatted-but-empty
+                # rows) before doing any per-row work
+                if not any(row_values):
+                    continue
+                
+                # Column B: FROM Designation ('Device' or 'Device.Pin' format)
+                # A single partition gives both parts; pinless devices have no dot.
+                from_device = from_pin = None
+                from_raw = row_values[from_idx]
+                if from_raw:
+                    from_device, sep, from_pin = from_raw.partition(".")
+                    if sep:
+                        # Pin is the segment after the first dot only ("J6.A.B" -> "A")
+                        from_pin = from_pin.partition(".")[0]
+                    else:
+                        from_pin = None
+                
+                # Column C: TO Designation ('Device' or 'Device.Pin' format)
+                to_device = to_pin = None
+                to_raw = row_values[to_idx]
+                if to_raw:
+                    to_device, sep, to_pin = to_raw.partition(".")
+                    if sep:
+                        # Pin is the segment after the first dot only ("J6.A.B" -> "A")
+                        to_pin = to_pin.partition(".")[0]
+                    else:
+                        to_pin = None
+                
+                # Column D: Conductor (extract wire index, e.g. "19" from "W19.Black")
+                wire_index = None
+                conductor_cell = row_values[conductor_idx]
+                # Non-text conductor cells (numbers, dates) have no wire index to extract
+                if conductor_cell and isinstance(conductor_cell, str):
+                    # Fast path for the usual "W19.Black" / "W19" form, which
+                    # avoids the regex engine entirely
+                    head = conductor_cell[1:] if conductor_cell[0] == 'W' else conductor_cell
+                    head = head.partition('.')[0]
+                    if head.isdecimal():
+                        wire_index = int(head)
+                    else:
+                        match = wire_idx_search(conductor_cell)
+                        if match:
+                            wire_index = int(match.group())
+                
+                # Column E: Wire Part Number - lookup in wire table
+                rh_wire_sku = row_values[wire_sku_idx]
+                wire = wire_lut_get(rh_wire_sku)
+                if wire is None and rh_wire_sku is not None:
+                    error_msg = f"Wire '{rh_wire_sku}' not found in lookup table"
+                    error = ConversionError(
+                        severity="error",
+                        error_type="WIRE_NOT_FOUND",
+                        row_number=row_num,
+                        entity_id="Wire",
+                        entity_value=str(rh_wire_sku),
+                        description=error_msg,
+                        timestamp=parse_timestamp
+                    )
+                    errors.append(error)
+                
+                # Build the row in one constructor call once every field is known.
+                # Column K/M: FROM/TO Connector Part Numbers, Column O: Signal Name
+                yield E3FromToListRow(
+                    from_device_name=from_device,
+                    from_device_pn=row_values[from_pn_idx],
+                    from_pin=from_pin,
+                    to_device_name=to_device,
+                    to_device_pn=row_values[to_pn_idx],
+                    to_pin=to_pin,
+                    wire=wire,
+                    signal_name=row_values[signal_idx],
+                    wire_index=wire_index,
                 )
-                errors.append(error)
-            
-            # Column K: FROM Connector Part Number
-            e3_fromto_row.from_device_pn = sheet.cell(row=row_num, column=self.COL_FROM_DEVICE_PN).value
-            
-            # Column M: TO Connector Part Number
-            e3_fromto_row.to_device_pn = sheet.cell(row=row_num, column=self.COL_TO_DEVICE_PN).value
-            
-            # Column O: Signal Name
-            e3_fromto_row.signal_name = sheet.cell(row=row_num, column=self.COL_SIGNAL_NAME).value
-            
-            e3_fromto.append(e3_fromto_row)
+                row_count += 1
+        finally:
+            # Read-only workbooks hold the file open until explicitly closed
+            rh_workbook.close()
         
         if verbose:
-            click.echo(f"Parsed {len(e3_fromto)} connections from RapidHarness")
-        
-        return e3_fromto
+            click.echo(f"Parsed {row_count} connections from RapidHarness")
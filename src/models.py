@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionError:
     """Represents an error or warning encountered during conversion.
     
@@ -15,7 +15,8 @@ class ConversionError:
         entity_id: What was being processed (e.g., "Wire", "FROM Device")
         entity_value: The value that caused the error
         description: Human-readable error message
-        timestamp: ISO timestamp of when error was recorded
+        timestamp: ISO timestamp of when error was recorded (defaults to now;
+            parsers pass one timestamp shared by every error from a pass)
     """
     severity: str  # "warning" or "error"
     error_type: str
@@ -26,7 +27,7 @@ class ConversionError:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class E3WireComponent:
     """Represents a valid individual wire type in the E3 database.
     
@@ -45,37 +46,13 @@ class E3WireComponent:
     """Wire Color. E3 seems to like 3-letter color codes like `PNK`, `RED`, `BRN`."""
 
 
-@dataclass(frozen=True)
-class RapidHarnessEndpoint:
-    """Represents a specific pin on a specific connector or device in RapidHarness."""
-    
-    raw_string: str
-    """The raw reference designator, unmodified. Format: 'Device' or 'Device.Pin'"""
-
-    def get_device_des(self) -> str:
-        """Return only the device/connector portion (strip away pin designation if present)."""
-        if not self.raw_string:
-            return None
-        return self.raw_string.split(".")[0]
-    
-    def get_pin_des(self) -> str:
-        """Return only the pin designation (strip away device designation).
-        
-        Returns None for pinless devices (no dot separator in raw_string).
-        """
-        if not self.raw_string:
-            return None
-        split_raw_str = self.raw_string.split(".")
-        if len(split_raw_str) == 1:
-            return None
-        return split_raw_str[1]
-
-
-@dataclass
+@dataclass(slots=True)
 class E3FromToListRow:
     """Represents a single connection in the E3 From-To List.
     
-    This is the intermediate format produced by all input parsers.
+    This is the intermediate format produced by all input parsers. One is
+    created per input row, so it uses ``__slots__`` instead of a per-instance
+    ``__dict__`` to keep large harnesses cheap in memory.
     """
     # FROM RefDes
     from_device_name: str = None
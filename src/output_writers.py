@@ -1,6 +1,7 @@
 """Output writing for E3.series From-To List format."""
 
 from pathlib import Path
+from typing import Iterable
 import openpyxl
 import click
 from colorama import Fore, Style
@@ -29,52 +30,67 @@ E3_HEADERS = [
     "Wire Gauge",
 ]
 
-# Column indices for writing (1-based)
-COL_FROM_DEVICE_NAME = 3
-COL_FROM_DEVICE_PN = 4
-COL_FROM_PIN = 5
-COL_TO_DEVICE_NAME = 9
-COL_TO_DEVICE_PN = 10
-COL_TO_PIN = 11
-COL_WIRE_NUMBER = 13
-COL_SIGNAL_NAME = 14
-COL_WIRE_TYPE = 15
-COL_WIRE_COLOR = 16
-COL_WIRE_GAUGE = 17
 
-
-def write_e3_fromto_list(rows: list, output_file: Path):
+def write_e3_fromto_list(rows: Iterable[E3FromToListRow], output_file: Path):
     """Write E3.series From-To List to Excel file.
     
+    Uses a write-only workbook so rows are streamed to the file as they are
+    appended rather than held in memory as individual cells.
+    
     Args:
-        rows: List of E3FromToListRow objects
+        rows: Iterable of E3FromToListRow objects (consumed once, so a
+            generator works)
         output_file: Path for output .xlsx file
+        
+    Returns:
+        int: Number of data rows written (excluding the header)
     """
-    workbook = openpyxl.Workbook()
-    worksheet = workbook.active
-    worksheet.title = "From-To List"
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("From-To List")
     
     # Write headers
-    for col_idx, header in enumerate(E3_HEADERS, start=1):
-        worksheet.cell(row=1, column=col_idx, value=header)
+    worksheet.append(E3_HEADERS)
     
-    # Write data rows
-    for row_idx, row in enumerate(rows, start=2):
-        worksheet.cell(row=row_idx, column=COL_FROM_DEVICE_NAME, value=row.from_device_name)
-        worksheet.cell(row=row_idx, column=COL_FROM_DEVICE_PN, value=row.from_device_pn)
-        worksheet.cell(row=row_idx, column=COL_FROM_PIN, value=row.from_pin)
-        
-        worksheet.cell(row=row_idx, column=COL_TO_DEVICE_NAME, value=row.to_device_name)
-        worksheet.cell(row=row_idx, column=COL_TO_DEVICE_PN, value=row.to_device_pn)
-        worksheet.cell(row=row_idx, column=COL_TO_PIN, value=row.to_pin)
-        
-        worksheet.cell(row=row_idx, column=COL_WIRE_NUMBER, value=row.wire_index)
-        worksheet.cell(row=row_idx, column=COL_SIGNAL_NAME, value=row.signal_name)
+    # Write data rows as one tuple each, laid out in E3_HEADERS order
+    row_count = 0
+    try:
+        for row in rows:
+            # Wire data (only present if not part of cable)
+            wire = row.wire
+            if isinstance(wire, E3WireComponent):
+                wire_type, wire_color, wire_gauge = wire.wire_group, wire.color, wire.wire_type
+            else:
+                wire_type = wire_color = wire_gauge = None
+            
+            worksheet.append((
+                None,                   # From Assignment
+                None,                   # From Location
+                row.from_device_name,   # From Device Name
+                row.from_device_pn,     # From Device Part #
+                row.from_pin,           # From Pin
+                None,                   # From Pin Part #
+                None,                   # To Assignment
+                None,                   # To Location
+                row.to_device_name,     # To Device Name
+                row.to_device_pn,       # To Device Part #
+                row.to_pin,             # To Pin
+                None,                   # To Pin Part #
+                row.wire_index,         # Wire/Conductor Number
+                row.signal_name,        # Signal
+                wire_type,              # Wire Type
+                wire_color,             # Wire Color
+                wire_gauge,             # Wire Gauge
+            ))
+            row_count += 1
         
-        # Wire data (only present if not part of cable)
-        if isinstance(row.wire, E3WireComponent):
-            worksheet.cell(row=row_idx, column=COL_WIRE_TYPE, value=row.wire.wire_group)
-            worksheet.cell(row=row_idx, column=COL_WIRE_COLOR, value=row.wire.color)
-            worksheet.cell(row=row_idx, column=COL_WIRE_GAUGE, value=row.wire.wire_type)
+        workbook.save(str(output_file))
+    except Exception:
+        # Rows come from a generator, so parsing and conversion errors surface
+        # here too. Close the worksheet (unless save() already did) so its row
+        # stream shuts down cleanly instead of failing noisily when the
+        # abandoned workbook is collected.
+        if not worksheet.closed:
+            worksheet.close()
+        raise
     
-    workbook.save(str(output_file))
+    return row_count
@@ -5,6 +5,20 @@ from pathlib import Path
 from models import E3WireComponent
 
 
+def _padded_rows(reader, width: int):
+    """Yield non-blank CSV rows, padded with None up to ``width`` fields.
+    
+    Mirrors DictReader, which skips blank lines and fills fields missing from
+    short rows with None, so column indices are always valid.
+    """
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row += [None] * (width - len(row))
+        yield row
+
+
 def load_wire_lookup_table(csv_path: Path) -> dict:
     """Load wire lookup table from CSV file.
     
@@ -20,13 +34,22 @@ def load_wire_lookup_table(csv_path: Path) -> dict:
     """
     wire_lut = {}
     with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            wire_lut[row['RapidHarness_Name']] = E3WireComponent(
-                wire_group=row['Wire_Group'],
-                wire_type=row['E3_Wire_Type'],
-                cross_section_awg=int(row['AWG_Gauge']),
-                color=row['Color']
+        reader = csv.reader(f)
+        # Resolve column positions once from the header instead of building a
+        # dict per row; a missing column raises ValueError
+        header = next(reader, [])
+        name_idx = header.index('RapidHarness_Name')
+        group_idx = header.index('Wire_Group')
+        type_idx = header.index('E3_Wire_Type')
+        awg_idx = header.index('AWG_Gauge')
+        color_idx = header.index('Color')
+        width = max(name_idx, group_idx, type_idx, awg_idx, color_idx) + 1
+        for row in _padded_rows(reader, width):
+            wire_lut[row[name_idx]] = E3WireComponent(
+                wire_group=row[group_idx],
+                wire_type=row[type_idx],
+                cross_section_awg=int(row[awg_idx]),
+                color=row[color_idx]
             )
     return wire_lut
 
@@ -44,9 +67,11 @@ def load_device_lookup_table(csv_path: Path) -> dict:
     Returns:
         dict: Maps RapidHarness part numbers to E3 device names
     """
-    device_lut = {}
     with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            device_lut[row['RapidHarness_PartNumber']] = row['E3_Device_Name']
+        reader = csv.reader(f)
+        header = next(reader, [])
+        pn_idx = header.index('RapidHarness_PartNumber')
+        name_idx = header.index('E3_Device_Name')
+        width = max(pn_idx, name_idx) + 1
+        device_lut = {row[pn_idx]: row[name_idx] for row in _padded_rows(reader, width)}
     return device_lut